@@ -6,5 +6,6 @@ from the Alpha Vantage API.
 """
 
 from .client import StockMarketClient
+from .async_client import AsyncStockMarketClient
 
-__all__ = ['StockMarketClient'] 
\ No newline at end of file
+__all__ = ['StockMarketClient', 'AsyncStockMarketClient'] 
\ No newline at end of file
@@ -0,0 +1,333 @@
+"""
+Async Stock Market Data Client using Alpha Vantage API.
+
+This client mirrors StockMarketClient but uses aiohttp so that many
+symbol queries can run concurrently on one event loop instead of
+blocking on the network one call at a time.
+"""
+
+import asyncio
+
+import aiohttp
+
+from aiolimiter import AsyncLimiter
+from typing import Dict, List, Optional, Any
+from utils.logger import get_logger
+from clients.alpha_vantage.client import (
+    APIError,
+    ConnectionError,
+    InvalidArgsError,
+    RateLimitError,
+    _DAILY_TS_KEY,
+    _INTRADAY_TS_KEY,
+    _VALID_INTERVALS,
+    _VALID_OUTPUTSIZE,
+    _norm_symbol,
+    _parse_response_body,
+    _validate_symbol,
+)
+
+logger = get_logger(__name__)
+
+
+class AsyncStockMarketClient:
+    """
+    An async client for fetching stock market data using Alpha Vantage API.
+
+    Intended to be used as an async context manager so that all requests
+    share one aiohttp session and connection pool:
+
+        async with AsyncStockMarketClient(api_key) as client:
+            quotes = await client.get_quotes(['AAPL', 'MSFT'])
+    """
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, timeout: Optional[int] = None, max_retries: Optional[int] = None, max_per_minute: Optional[int] = None):
+        """
+        Initialize the AsyncStockMarketClient.
+
+        Args:
+            api_key (str, optional): Alpha Vantage API key.
+            max_per_minute (int, optional): Outbound request cap; defaults
+                                   to the free-tier limit of 5 per minute.
+
+        Raises:
+            InvalidArgsError: If no API key is available
+        """
+        if not api_key:
+            raise InvalidArgsError("missing api key")
+
+        self.api_key = api_key
+        self.base_url = base_url or 'https://www.alphavantage.co/query'
+        self.timeout = timeout or 30
+        self.max_retries = max_retries or 3
+        self.max_per_minute = max_per_minute or 5
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._limiter = AsyncLimiter(max_rate=self.max_per_minute, time_period=60)
+
+        logger.info("AsyncStockMarketClient initialized successfully")
+
+    async def __aenter__(self) -> 'AsyncStockMarketClient':
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=64, ttl_dns_cache=300)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _make_request(self, params: Dict[str, Any], response_key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Make a request to the Alpha Vantage API.
+
+        Args:
+            params: Request parameters
+            response_key: If given, only this top-level subtree of the
+                   response is returned
+
+        Returns:
+            API response data
+
+        Raises:
+            ConnectionError: If there's a connection issue
+            RateLimitError: If rate limit is exceeded
+            APIError: If there's an API error
+        """
+        if self._session is None:
+            raise APIError("Client session not started, use 'async with' to open the client")
+
+        params['apikey'] = self.api_key
+
+        for attempt in range(self.max_retries):
+            try:
+                logger.debug("Making API request: %s", params.get('function', 'unknown'))
+                async with self._limiter:
+                    async with self._session.get(
+                        self.base_url,
+                        params=params,
+                        timeout=aiohttp.ClientTimeout(total=self.timeout)
+                    ) as response:
+                        response.raise_for_status()
+                        data = _parse_response_body(await response.read())
+
+                # Check for API errors
+                if 'Error Message' in data:
+                    error_msg = data['Error Message']
+                    logger.error("API Error: %s", error_msg)
+                    raise APIError(f"Alpha Vantage API Error: {error_msg}")
+
+                # Check for rate limiting
+                if 'Note' in data:
+                    note = data['Note']
+                    logger.warning("API Rate Limit: %s", note)
+                    raise RateLimitError(f"Alpha Vantage Rate Limit: {note}")
+
+                if response_key is not None:
+                    return data.get(response_key, {})
+
+                return data
+
+            except asyncio.TimeoutError:
+                logger.warning("Request timeout (attempt %s/%s)", attempt + 1, self.max_retries)
+                if attempt == self.max_retries - 1:
+                    raise ConnectionError("Request timeout after all retries")
+
+            except aiohttp.ClientConnectionError as e:
+                logger.error("Connection error: %s", e)
+                raise ConnectionError(f"Failed to connect to Alpha Vantage API: {e}")
+
+            except aiohttp.ClientError as e:
+                logger.error("Request error: %s", e)
+                raise APIError(f"Request failed: {e}")
+
+        # This should never be reached, but mypy requires it
+        raise APIError("Request failed after all retries")
+
+    async def get_quote(self, symbol: str) -> Dict[str, Any]:
+        """
+        Get real-time quote for a stock symbol.
+
+        Args:
+            symbol (str): Stock symbol (e.g., 'AAPL', 'MSFT')
+
+        Returns:
+            Dict containing quote information
+
+        Raises:
+            InvalidArgsError: If symbol is invalid
+            APIError: If API request fails
+        """
+        _validate_symbol(symbol)
+
+        symbol = _norm_symbol(symbol)
+        logger.info("Fetching quote for symbol: %s", symbol)
+
+        params = {
+            'function': 'GLOBAL_QUOTE',
+            'symbol': symbol
+        }
+
+        try:
+            quote_data = await self._make_request(params, 'Global Quote')
+
+            if not quote_data:
+                logger.warning("No quote data found for symbol: %s", symbol)
+                return {}
+
+            logger.info("Successfully fetched quote for %s", symbol)
+            return quote_data
+
+        except Exception as e:
+            logger.error("Failed to fetch quote for %s: %s", symbol, e)
+            raise
+
+    async def get_quotes(self, symbols: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get real-time quotes for several stock symbols concurrently.
+
+        Args:
+            symbols: List of stock symbols (e.g., ['AAPL', 'MSFT'])
+
+        Returns:
+            List of quote dicts, in the same order as the input symbols
+
+        Raises:
+            InvalidArgsError: If symbols is empty or not a list
+            APIError: If any API request fails
+        """
+        if not symbols or not isinstance(symbols, list):
+            raise InvalidArgsError("Symbols must be a non-empty list")
+
+        logger.info("Fetching quotes for %s symbols concurrently", len(symbols))
+        return await asyncio.gather(*[self.get_quote(symbol) for symbol in symbols])
+
+    async def get_daily_data(self, symbol: str, outputsize: str = 'compact') -> Dict[str, Any]:
+        """
+        Get daily historical data for a stock symbol.
+
+        Args:
+            symbol (str): Stock symbol (e.g., 'AAPL', 'MSFT')
+            outputsize (str): 'compact' (last 100 data points) or 'full' (up to 20 years)
+
+        Returns:
+            Dict mapping dates to daily OHLCV data
+
+        Raises:
+            InvalidArgsError: If arguments are invalid
+            APIError: If API request fails
+        """
+        _validate_symbol(symbol)
+
+        if outputsize not in _VALID_OUTPUTSIZE:
+            raise InvalidArgsError("Output size must be 'compact' or 'full'")
+
+        symbol = _norm_symbol(symbol)
+        logger.info("Fetching daily data for symbol: %s, outputsize: %s", symbol, outputsize)
+
+        params = {
+            'function': 'TIME_SERIES_DAILY',
+            'symbol': symbol,
+            'outputsize': outputsize
+        }
+
+        try:
+            data = await self._make_request(params, _DAILY_TS_KEY)
+
+            if not data:
+                logger.warning("No daily data found for symbol: %s", symbol)
+                return {}
+
+            logger.info("Successfully fetched daily data for %s", symbol)
+            return data
+
+        except Exception as e:
+            logger.error("Failed to fetch daily data for %s: %s", symbol, e)
+            raise
+
+    async def get_intraday_data(self, symbol: str, interval: str = '5min', outputsize: str = 'compact') -> Dict[str, Any]:
+        """
+        Get intraday data for a stock symbol.
+
+        Args:
+            symbol (str): Stock symbol (e.g., 'AAPL', 'MSFT')
+            interval (str): Time interval ('1min', '5min', '15min', '30min', '60min')
+            outputsize (str): 'compact' (last 100 data points) or 'full'
+
+        Returns:
+            Dict containing intraday time series data
+
+        Raises:
+            InvalidArgsError: If arguments are invalid
+            APIError: If API request fails
+        """
+        _validate_symbol(symbol)
+
+        if interval not in _VALID_INTERVALS:
+            raise InvalidArgsError(f"Interval must be one of: {sorted(_VALID_INTERVALS)}")
+
+        if outputsize not in _VALID_OUTPUTSIZE:
+            raise InvalidArgsError("Output size must be 'compact' or 'full'")
+
+        symbol = _norm_symbol(symbol)
+        logger.info("Fetching intraday data for symbol: %s, interval: %s", symbol, interval)
+
+        params = {
+            'function': 'TIME_SERIES_INTRADAY',
+            'symbol': symbol,
+            'interval': interval,
+            'outputsize': outputsize
+        }
+
+        try:
+            data = await self._make_request(params)
+
+            if not data.get(_INTRADAY_TS_KEY[interval]):
+                logger.warning("No intraday data found for symbol: %s", symbol)
+                return {}
+
+            logger.info("Successfully fetched intraday data for %s", symbol)
+            return data
+
+        except Exception as e:
+            logger.error("Failed to fetch intraday data for %s: %s", symbol, e)
+            raise
+
+    async def search_stocks(self, keywords: str) -> List[Dict[str, Any]]:
+        """
+        Search for stocks by keywords.
+
+        Args:
+            keywords (str): Search keywords
+
+        Returns:
+            List of matching stocks
+
+        Raises:
+            InvalidArgsError: If keywords are invalid
+            APIError: If API request fails
+        """
+        if not keywords or not isinstance(keywords, str):
+            raise InvalidArgsError("Keywords must be a non-empty string")
+
+        keywords = keywords.strip()
+        logger.info("Searching stocks with keywords: %s", keywords)
+
+        params = {
+            'function': 'SYMBOL_SEARCH',
+            'keywords': keywords
+        }
+
+        try:
+            matches = await self._make_request(params, 'bestMatches') or []
+
+            logger.info("Found %s matches for keywords: %s", len(matches), keywords)
+            return matches
+
+        except Exception as e:
+            logger.error("Failed to search stocks with keywords '%s': %s", keywords, e)
+            raise
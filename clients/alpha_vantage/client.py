@@ -5,13 +5,74 @@ This client provides methods to fetch various types of stock market data
 using the Alpha Vantage API with proper error handling and logging.
 """
 
+import json
+import random
+import time
+
 import requests
 
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from utils.cache import FileCache
 from utils.logger import get_logger
+from utils.ratelimit import TokenBucket
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
 
 logger = get_logger(__name__)
 
+
+def _parse_response_body(body: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it's available."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+# How long a cached response stays fresh, per API function (seconds).
+# Functions not listed here are never cached.
+CACHE_TTL = {
+    'GLOBAL_QUOTE': 60,
+    'TIME_SERIES_INTRADAY': 3600,
+    'TIME_SERIES_DAILY': 86400,
+    'OVERVIEW': 86400,
+    'SYMBOL_SEARCH': 86400,
+    'MARKET_STATUS': 300,
+    'TOP_GAINERS_LOSERS': 300,
+}
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Validation sets and response keys, built once instead of per call
+_VALID_INTERVALS = frozenset({'1min', '5min', '15min', '30min', '60min'})
+_VALID_OUTPUTSIZE = frozenset({'compact', 'full'})
+_DAILY_TS_KEY = 'Time Series (Daily)'
+_INTRADAY_TS_KEY = {interval: f'Time Series ({interval})' for interval in _VALID_INTERVALS}
+
+# Per-function request parameter templates, copied instead of rebuilt per call
+_QUOTE_TMPL = {'function': 'GLOBAL_QUOTE'}
+_BULK_QUOTES_TMPL = {'function': 'REALTIME_BULK_QUOTES'}
+_DAILY_TMPL = {'function': 'TIME_SERIES_DAILY'}
+_INTRADAY_TMPL = {'function': 'TIME_SERIES_INTRADAY'}
+_SEARCH_TMPL = {'function': 'SYMBOL_SEARCH'}
+_OVERVIEW_TMPL = {'function': 'OVERVIEW'}
+_MARKET_STATUS_TMPL = {'function': 'MARKET_STATUS'}
+_GAINERS_LOSERS_TMPL = {'function': 'TOP_GAINERS_LOSERS'}
+
 # Custom exception classes for the Alpha Vantage client
 class AlphaVantageError(Exception):
     """Base exception class for all Alpha Vantage client errors."""
@@ -43,6 +104,18 @@ class DataNotFoundError(AlphaVantageError):
     pass
 
 
+def _validate_symbol(symbol: Any) -> None:
+    """Reject anything that isn't a non-empty string."""
+    if not symbol or not isinstance(symbol, str):
+        raise InvalidArgsError("Symbol must be a non-empty string")
+
+
+def _norm_symbol(symbol: str) -> str:
+    """Normalize a symbol in one pass, skipping allocation when possible."""
+    trimmed = symbol.strip()
+    return trimmed if trimmed.isupper() else trimmed.upper()
+
+
 class StockMarketClient:
     """
     A client for fetching stock market data using Alpha Vantage API.
@@ -55,14 +128,16 @@ class StockMarketClient:
     - Search for stocks
     """
     
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, timeout: Optional[int] = None, max_retries: Optional[int] = None):
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, timeout: Optional[int] = None, max_retries: Optional[int] = None, max_per_minute: Optional[int] = None):
         """
         Initialize the StockMarketClient.
-        
+
         Args:
             api_key (str, optional): Alpha Vantage API key. If not provided,
                                    will try to get from configuration.
-                                   
+            max_per_minute (int, optional): Outbound request cap; defaults
+                                   to the free-tier limit of 5 per minute.
+
         Raises:
             InvalidArgsError: If no API key is available
         """
@@ -73,64 +148,152 @@ class StockMarketClient:
         self.base_url = base_url or 'https://www.alphavantage.co/query'
         self.timeout = timeout or 30
         self.max_retries = max_retries or 3
-        
+        self.max_per_minute = max_per_minute or 5
+
+        # Reuse one session so keep-alive connections are pooled instead of
+        # paying the TCP + TLS handshake on every request. Transient faults
+        # are retried inside the pool, on the same socket, with back-off
+        # and Retry-After support handled by urllib3.
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=1.0,
+            backoff_jitter=0.5,
+            status_forcelist=RETRYABLE_STATUS_CODES,
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+        )
+        self._session = requests.Session()
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=32)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.headers.update({
+            'User-Agent': 'agents-stock-market-client',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        # The session merges these into every request's query string, so
+        # per-call param dicts never carry (or log) the secret key
+        self._session.params = {'apikey': self.api_key}
+
+        self._cache = FileCache()
+        self._limiter = TokenBucket(
+            rate=self.max_per_minute / 60.0, capacity=self.max_per_minute
+        )
+
         logger.info("StockMarketClient initialized successfully")
-    
-    def _make_request(self, params: Dict[str, Any]) -> Dict[str, Any]:
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> 'StockMarketClient':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Compute how long to sleep before the next retry attempt.
+
+        Uses randomized exponential back-off so that concurrent clients
+        don't retry in lockstep, but prefers the server's Retry-After
+        header when one is present.
+        """
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except (TypeError, ValueError):
+                    pass
+        return min(60, 1.0 * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+    def _make_request(self, params: Dict[str, Any], response_key: Optional[str] = None, cache: bool = True) -> Dict[str, Any]:
         """
         Make a request to the Alpha Vantage API.
-        
+
         Args:
             params: Request parameters
-            
+            response_key: If given, only this top-level subtree of the
+                   response is returned (and cached), so the rest of the
+                   payload can be collected immediately
+            cache: Whether a fresh cached response may be returned instead
+                   of hitting the network
+
         Returns:
             API response data
-            
+
         Raises:
             ConnectionError: If there's a connection issue
             RateLimitError: If rate limit is exceeded
             APIError: If there's an API error
         """
-        params['apikey'] = self.api_key
-        
+        function = params.get('function')
+        ttl = CACHE_TTL.get(function)
+        cache_key = None
+
+        if cache and ttl:
+            cache_key = FileCache.make_key(params)
+            cached = self._cache.get(function, cache_key, ttl)
+            if cached is not None:
+                logger.debug("Cache hit for %s", function)
+                return cached
+
+        # Timeouts and retryable HTTP statuses are handled inside the
+        # adapter by urllib3's Retry; only the HTTP-200 "Note" rate-limit
+        # body needs retrying here, since urllib3 never sees it.
         for attempt in range(self.max_retries):
             try:
-                logger.debug(f"Making API request: {params.get('function', 'unknown')}")
-                response = requests.get(
-                    self.base_url, 
-                    params=params, 
+                logger.debug("Making API request: %s", params.get('function', 'unknown'))
+                self._limiter.acquire()
+                response = self._session.get(
+                    self.base_url,
+                    params=params,
                     timeout=self.timeout
                 )
                 response.raise_for_status()
-                data = response.json()
-                
-                # Check for API errors
-                if 'Error Message' in data:
-                    error_msg = data['Error Message']
-                    logger.error(f"API Error: {error_msg}")
-                    raise APIError(f"Alpha Vantage API Error: {error_msg}")
-                
-                # Check for rate limiting
-                if 'Note' in data:
-                    note = data['Note']
-                    logger.warning(f"API Rate Limit: {note}")
-                    raise RateLimitError(f"Alpha Vantage Rate Limit: {note}")
-                
-                return data
-                
+
             except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout (attempt {attempt + 1}/{self.max_retries})")
-                if attempt == self.max_retries - 1:
-                    raise ConnectionError("Request timeout after all retries")
-                    
+                logger.error("Request timeout after adapter retries")
+                raise ConnectionError("Request timeout after all retries")
+
             except requests.exceptions.ConnectionError as e:
-                logger.error(f"Connection error: {e}")
+                logger.error("Connection error: %s", e)
                 raise ConnectionError(f"Failed to connect to Alpha Vantage API: {e}")
-                
+
+            except requests.exceptions.RetryError as e:
+                logger.error("Retries exhausted: %s", e)
+                raise APIError(f"Request failed after all retries: {e}")
+
             except requests.exceptions.RequestException as e:
-                logger.error(f"Request error: {e}")
+                logger.error("Request error: %s", e)
                 raise APIError(f"Request failed: {e}")
-        
+
+            data = _parse_response_body(response.content)
+
+            # Check for API errors
+            if 'Error Message' in data:
+                error_msg = data['Error Message']
+                logger.error("API Error: %s", error_msg)
+                raise APIError(f"Alpha Vantage API Error: {error_msg}")
+
+            # Check for rate limiting
+            if 'Note' in data:
+                note = data['Note']
+                logger.warning("API Rate Limit: %s", note)
+                if attempt < self.max_retries - 1:
+                    time.sleep(self._retry_delay(attempt, response))
+                    continue
+                raise RateLimitError(f"Alpha Vantage Rate Limit: {note}")
+
+            if response_key is not None:
+                data = data.get(response_key, {})
+
+            if cache_key is not None:
+                self._cache.set(function, cache_key, data)
+
+            return data
+
         # This should never be reached, but mypy requires it
         raise APIError("Request failed after all retries")
     
@@ -148,32 +311,73 @@ class StockMarketClient:
             InvalidArgsError: If symbol is invalid
             APIError: If API request fails
         """
-        if not symbol or not isinstance(symbol, str):
-            raise InvalidArgsError("Symbol must be a non-empty string")
+        _validate_symbol(symbol)
         
-        symbol = symbol.upper().strip()
-        logger.info(f"Fetching quote for symbol: {symbol}")
+        symbol = _norm_symbol(symbol)
+        logger.info("Fetching quote for symbol: %s", symbol)
         
-        params = {
-            'function': 'GLOBAL_QUOTE',
-            'symbol': symbol
-        }
+        params = {**_QUOTE_TMPL, 'symbol': symbol}
         
         try:
-            data = self._make_request(params)
-            quote_data = data.get('Global Quote', {})
-            
+            quote_data = self._make_request(params, 'Global Quote')
+
             if not quote_data:
-                logger.warning(f"No quote data found for symbol: {symbol}")
+                logger.warning("No quote data found for symbol: %s", symbol)
                 return {}
             
-            logger.info(f"Successfully fetched quote for {symbol}")
+            logger.info("Successfully fetched quote for %s", symbol)
             return quote_data
             
         except Exception as e:
-            logger.error(f"Failed to fetch quote for {symbol}: {e}")
+            logger.error("Failed to fetch quote for %s: %s", symbol, e)
             raise
     
+    def get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get real-time quotes for several stock symbols in bulk.
+
+        Symbols are batched 100 at a time into the REALTIME_BULK_QUOTES
+        endpoint, so N symbols cost ceil(N/100) requests instead of N.
+
+        Args:
+            symbols: List of stock symbols (e.g., ['AAPL', 'MSFT'])
+
+        Returns:
+            Dict mapping each symbol to its quote data
+
+        Raises:
+            InvalidArgsError: If symbols is empty or contains invalid entries
+            APIError: If API request fails
+        """
+        if not symbols or not isinstance(symbols, list):
+            raise InvalidArgsError("Symbols must be a non-empty list")
+
+        cleaned = []
+        for symbol in symbols:
+            if not symbol or not isinstance(symbol, str):
+                raise InvalidArgsError("Each symbol must be a non-empty string")
+            cleaned.append(_norm_symbol(symbol))
+
+        logger.info("Fetching bulk quotes for %s symbols", len(cleaned))
+
+        quotes: Dict[str, Dict[str, Any]] = {}
+        try:
+            for i in range(0, len(cleaned), 100):
+                chunk = cleaned[i:i + 100]
+                params = {**_BULK_QUOTES_TMPL, 'symbol': ','.join(chunk)}
+                data = self._make_request(params)
+                for quote in data.get('data', []):
+                    symbol = quote.get('symbol')
+                    if symbol:
+                        quotes[symbol] = quote
+
+            logger.info("Successfully fetched %s bulk quotes", len(quotes))
+            return quotes
+
+        except Exception as e:
+            logger.error("Failed to fetch bulk quotes: %s", e)
+            raise
+
     def get_daily_data(self, symbol: str, outputsize: str = 'compact') -> Dict[str, Any]:
         """
         Get daily historical data for a stock symbol.
@@ -183,41 +387,110 @@ class StockMarketClient:
             outputsize (str): 'compact' (last 100 data points) or 'full' (up to 20 years)
             
         Returns:
-            Dict containing daily time series data
-            
+            Dict mapping dates to daily OHLCV data
+
         Raises:
             InvalidArgsError: If arguments are invalid
             APIError: If API request fails
         """
-        if not symbol or not isinstance(symbol, str):
-            raise InvalidArgsError("Symbol must be a non-empty string")
-        
-        if outputsize not in ['compact', 'full']:
+        _validate_symbol(symbol)
+
+        if outputsize not in _VALID_OUTPUTSIZE:
             raise InvalidArgsError("Output size must be 'compact' or 'full'")
-        
-        symbol = symbol.upper().strip()
-        logger.info(f"Fetching daily data for symbol: {symbol}, outputsize: {outputsize}")
-        
-        params = {
-            'function': 'TIME_SERIES_DAILY',
-            'symbol': symbol,
-            'outputsize': outputsize
-        }
-        
+
+        symbol = _norm_symbol(symbol)
+        logger.info("Fetching daily data for symbol: %s, outputsize: %s", symbol, outputsize)
+
+        params = {**_DAILY_TMPL, 'symbol': symbol, 'outputsize': outputsize}
+
         try:
-            data = self._make_request(params)
-            
-            if not data.get('Time Series (Daily)'):
-                logger.warning(f"No daily data found for symbol: {symbol}")
+            data = self._make_request(params, _DAILY_TS_KEY)
+
+            if not data:
+                logger.warning("No daily data found for symbol: %s", symbol)
                 return {}
-            
-            logger.info(f"Successfully fetched daily data for {symbol}")
+
+            logger.info("Successfully fetched daily data for %s", symbol)
             return data
-            
+
         except Exception as e:
-            logger.error(f"Failed to fetch daily data for {symbol}: {e}")
+            logger.error("Failed to fetch daily data for %s: %s", symbol, e)
             raise
     
+    def iter_daily(self, symbol: str, outputsize: str = 'compact') -> Iterator[Tuple[str, float, float, float, float, int]]:
+        """
+        Iterate daily OHLCV rows for a symbol in ascending date order.
+
+        Yields (date, open, high, low, close, volume) tuples lazily, so
+        a 'full' multi-thousand-entry history is parsed one row at a
+        time instead of being converted into a second structure up front.
+
+        Args:
+            symbol (str): Stock symbol (e.g., 'AAPL', 'MSFT')
+            outputsize (str): 'compact' (last 100 data points) or 'full' (up to 20 years)
+
+        Yields:
+            Tuples of (date, open, high, low, close, volume)
+
+        Raises:
+            InvalidArgsError: If arguments are invalid
+            APIError: If API request fails
+        """
+        series = self.get_daily_data(symbol, outputsize)
+        for date in sorted(series):
+            row = series[date]
+            yield (
+                date,
+                float(row['1. open']),
+                float(row['2. high']),
+                float(row['3. low']),
+                float(row['4. close']),
+                int(row['5. volume']),
+            )
+
+    def get_daily_frame(self, symbol: str, outputsize: str = 'compact') -> 'pandas.DataFrame':
+        """
+        Get daily OHLCV data as a pandas DataFrame indexed by date.
+
+        Columns are built with numpy.fromiter, giving one contiguous
+        array per OHLCV field instead of a dict per row. Requires the
+        optional numpy and pandas dependencies.
+
+        Args:
+            symbol (str): Stock symbol (e.g., 'AAPL', 'MSFT')
+            outputsize (str): 'compact' (last 100 data points) or 'full' (up to 20 years)
+
+        Returns:
+            DataFrame with open/high/low/close/volume columns, oldest first
+
+        Raises:
+            AlphaVantageError: If numpy or pandas is not installed
+            InvalidArgsError: If arguments are invalid
+            APIError: If API request fails
+        """
+        if numpy is None or pandas is None:
+            raise AlphaVantageError("numpy and pandas are required for get_daily_frame")
+
+        series = self.get_daily_data(symbol, outputsize)
+        dates = sorted(series)
+        count = len(dates)
+
+        def column(key, convert):
+            return (convert(series[date][key]) for date in dates)
+
+        frame = pandas.DataFrame(
+            {
+                'open': numpy.fromiter(column('1. open', float), numpy.float64, count),
+                'high': numpy.fromiter(column('2. high', float), numpy.float64, count),
+                'low': numpy.fromiter(column('3. low', float), numpy.float64, count),
+                'close': numpy.fromiter(column('4. close', float), numpy.float64, count),
+                'volume': numpy.fromiter(column('5. volume', int), numpy.int64, count),
+            },
+            index=pandas.to_datetime(dates),
+        )
+        frame.index.name = 'date'
+        return frame
+
     def get_intraday_data(self, symbol: str, interval: str = '5min', outputsize: str = 'compact') -> Dict[str, Any]:
         """
         Get intraday data for a stock symbol.
@@ -234,21 +507,19 @@ class StockMarketClient:
             InvalidArgsError: If arguments are invalid
             APIError: If API request fails
         """
-        if not symbol or not isinstance(symbol, str):
-            raise InvalidArgsError("Symbol must be a non-empty string")
+        _validate_symbol(symbol)
         
-        valid_intervals = ['1min', '5min', '15min', '30min', '60min']
-        if interval not in valid_intervals:
-            raise InvalidArgsError(f"Interval must be one of: {valid_intervals}")
-        
-        if outputsize not in ['compact', 'full']:
+        if interval not in _VALID_INTERVALS:
+            raise InvalidArgsError(f"Interval must be one of: {sorted(_VALID_INTERVALS)}")
+
+        if outputsize not in _VALID_OUTPUTSIZE:
             raise InvalidArgsError("Output size must be 'compact' or 'full'")
         
-        symbol = symbol.upper().strip()
-        logger.info(f"Fetching intraday data for symbol: {symbol}, interval: {interval}")
+        symbol = _norm_symbol(symbol)
+        logger.info("Fetching intraday data for symbol: %s, interval: %s", symbol, interval)
         
         params = {
-            'function': 'TIME_SERIES_INTRADAY',
+            **_INTRADAY_TMPL,
             'symbol': symbol,
             'interval': interval,
             'outputsize': outputsize
@@ -256,23 +527,16 @@ class StockMarketClient:
         
         try:
             data = self._make_request(params)
-            
-            # Find the time series key
-            time_series_key = None
-            for key in data.keys():
-                if 'Time Series' in key:
-                    time_series_key = key
-                    break
-            
-            if not time_series_key or not data.get(time_series_key):
-                logger.warning(f"No intraday data found for symbol: {symbol}")
+
+            if not data.get(_INTRADAY_TS_KEY[interval]):
+                logger.warning("No intraday data found for symbol: %s", symbol)
                 return {}
             
-            logger.info(f"Successfully fetched intraday data for {symbol}")
+            logger.info("Successfully fetched intraday data for %s", symbol)
             return data
             
         except Exception as e:
-            logger.error(f"Failed to fetch intraday data for {symbol}: {e}")
+            logger.error("Failed to fetch intraday data for %s: %s", symbol, e)
             raise
     
     def search_stocks(self, keywords: str) -> List[Dict[str, Any]]:
@@ -293,22 +557,18 @@ class StockMarketClient:
             raise InvalidArgsError("Keywords must be a non-empty string")
         
         keywords = keywords.strip()
-        logger.info(f"Searching stocks with keywords: {keywords}")
+        logger.info("Searching stocks with keywords: %s", keywords)
         
-        params = {
-            'function': 'SYMBOL_SEARCH',
-            'keywords': keywords
-        }
+        params = {**_SEARCH_TMPL, 'keywords': keywords}
         
         try:
-            data = self._make_request(params)
-            matches = data.get('bestMatches', [])
+            matches = self._make_request(params, 'bestMatches') or []
             
-            logger.info(f"Found {len(matches)} matches for keywords: {keywords}")
+            logger.info("Found %s matches for keywords: %s", len(matches), keywords)
             return matches
             
         except Exception as e:
-            logger.error(f"Failed to search stocks with keywords '{keywords}': {e}")
+            logger.error("Failed to search stocks with keywords '%s': %s", keywords, e)
             raise
     
     def get_company_overview(self, symbol: str) -> Dict[str, Any]:
@@ -325,29 +585,25 @@ class StockMarketClient:
             InvalidArgsError: If symbol is invalid
             APIError: If API request fails
         """
-        if not symbol or not isinstance(symbol, str):
-            raise InvalidArgsError("Symbol must be a non-empty string")
+        _validate_symbol(symbol)
         
-        symbol = symbol.upper().strip()
-        logger.info(f"Fetching company overview for symbol: {symbol}")
+        symbol = _norm_symbol(symbol)
+        logger.info("Fetching company overview for symbol: %s", symbol)
         
-        params = {
-            'function': 'OVERVIEW',
-            'symbol': symbol
-        }
+        params = {**_OVERVIEW_TMPL, 'symbol': symbol}
         
         try:
             data = self._make_request(params)
             
             if not data or len(data) <= 1:  # Only has Symbol key or empty
-                logger.warning(f"No company overview found for symbol: {symbol}")
+                logger.warning("No company overview found for symbol: %s", symbol)
                 return {}
             
-            logger.info(f"Successfully fetched company overview for {symbol}")
+            logger.info("Successfully fetched company overview for %s", symbol)
             return data
             
         except Exception as e:
-            logger.error(f"Failed to fetch company overview for {symbol}: {e}")
+            logger.error("Failed to fetch company overview for %s: %s", symbol, e)
             raise
     
     def get_market_status(self) -> Dict[str, Any]:
@@ -362,9 +618,7 @@ class StockMarketClient:
         """
         logger.info("Fetching market status")
         
-        params = {
-            'function': 'MARKET_STATUS'
-        }
+        params = _MARKET_STATUS_TMPL.copy()
         
         try:
             data = self._make_request(params)
@@ -377,7 +631,7 @@ class StockMarketClient:
             return data
             
         except Exception as e:
-            logger.error(f"Failed to fetch market status: {e}")
+            logger.error("Failed to fetch market status: %s", e)
             raise
     
     def get_top_gainers_losers(self) -> Dict[str, Any]:
@@ -392,9 +646,7 @@ class StockMarketClient:
         """
         logger.info("Fetching top gainers and losers")
         
-        params = {
-            'function': 'TOP_GAINERS_LOSERS'
-        }
+        params = _GAINERS_LOSERS_TMPL.copy()
         
         try:
             data = self._make_request(params)
@@ -407,5 +659,5 @@ class StockMarketClient:
             return data
             
         except Exception as e:
-            logger.error(f"Failed to fetch top gainers/losers: {e}")
+            logger.error("Failed to fetch top gainers/losers: %s", e)
             raise 
\ No newline at end of file
@@ -7,8 +7,10 @@ All tests are fully mocked to avoid making actual API calls.
 """
 
 import unittest
+import json
 import os
 import sys
+import tempfile
 from unittest.mock import patch, Mock, MagicMock
 import requests
 
@@ -21,15 +23,29 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from clients.alpha_vantage.client import StockMarketClient
 from clients.alpha_vantage.client import InvalidArgsError, APIError, RateLimitError, ConnectionError
+from utils.cache import FileCache
+
+def make_response(payload):
+    """Build a mocked HTTP response carrying the given JSON payload."""
+    response = Mock()
+    response.status_code = 200
+    response.content = json.dumps(payload).encode()
+    response.json.return_value = payload
+    response.raise_for_status.return_value = None
+    return response
 
 class TestStockMarketClient(unittest.TestCase):
     """Test cases for StockMarketClient."""
-    
+
     def setUp(self):
         """Set up test fixtures."""
         # For testing, we'll use a mock API key
         self.api_key = "test_api_key"
         self.client = StockMarketClient(self.api_key)
+        # Keep the response cache isolated per test
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._cache_dir.cleanup)
+        self.client._cache = FileCache(cache_dir=self._cache_dir.name)
     
     def test_init_with_api_key(self):
         """Test client initialization with API key."""
@@ -57,20 +73,18 @@ class TestStockMarketClient(unittest.TestCase):
         with self.assertRaises(InvalidArgsError):
             StockMarketClient()
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_quote_success(self, mock_get):
         """Test successful quote retrieval."""
         # Mock successful response
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = make_response({
             'Global Quote': {
                 '01. symbol': 'AAPL',
                 '05. price': '150.00',
                 '09. change': '2.50',
                 '10. change percent': '1.69%'
             }
-        }
-        mock_response.raise_for_status.return_value = None
+        })
         mock_get.return_value = mock_response
         
         result = self.client.get_quote("AAPL")
@@ -79,35 +93,72 @@ class TestStockMarketClient(unittest.TestCase):
         self.assertEqual(result['05. price'], '150.00')
         mock_get.assert_called_once()
     
-    @patch('requests.get')
-    def test_get_quote_rate_limit(self, mock_get):
-        """Test quote retrieval with rate limit."""
+    @patch('requests.Session.get')
+    def test_get_quote_uses_cache(self, mock_get):
+        """Test that a repeated quote request is served from the cache."""
+        mock_response = make_response({
+            'Global Quote': {'01. symbol': 'AAPL', '05. price': '150.00'}
+        })
+        mock_get.return_value = mock_response
+
+        first = self.client.get_quote("AAPL")
+        second = self.client.get_quote("AAPL")
+
+        self.assertEqual(first, second)
+        mock_get.assert_called_once()
+
+    @patch('requests.Session.get')
+    def test_cache_override_forces_network(self, mock_get):
+        """Test that cache=False bypasses the response cache."""
+        mock_response = make_response({'markets': [{'region': 'United States'}]})
+        mock_get.return_value = mock_response
+
+        self.client._make_request({'function': 'MARKET_STATUS'})
+        self.client._make_request({'function': 'MARKET_STATUS'}, cache=False)
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_get_quote_rate_limit(self, mock_get, mock_sleep):
+        """Test quote retrieval with persistent rate limiting."""
         # Mock rate limit response
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = make_response({
             'Note': 'Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute and 500 calls per day.'
-        }
-        mock_response.raise_for_status.return_value = None
+        })
+        mock_response.headers = {}
         mock_get.return_value = mock_response
-        
+
         with self.assertRaises(RateLimitError):
             self.client.get_quote("AAPL")
+
+        # Rate-limited responses are retried with back-off before giving up
+        self.assertEqual(mock_get.call_count, self.client.max_retries)
+        self.assertEqual(mock_sleep.call_count, self.client.max_retries - 1)
+
+    def test_adapter_retry_configuration(self):
+        """Test that transport retries are mounted on the session adapter."""
+        adapter = self.client._session.get_adapter('https://www.alphavantage.co')
+        retry = adapter.max_retries
+
+        self.assertEqual(retry.total, self.client.max_retries)
+        self.assertIn(503, retry.status_forcelist)
+        self.assertIn(429, retry.status_forcelist)
+        self.assertTrue(retry.respect_retry_after_header)
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_quote_api_error(self, mock_get):
         """Test quote retrieval with API error."""
         # Mock API error response
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = make_response({
             'Error Message': 'Invalid API call. Please retry or visit the documentation (https://www.alphavantage.co/documentation/) for TIME_SERIES_DAILY.'
-        }
-        mock_response.raise_for_status.return_value = None
+        })
         mock_get.return_value = mock_response
         
         with self.assertRaises(APIError):
             self.client.get_quote("INVALID")
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_quote_connection_error(self, mock_get):
         """Test quote retrieval with connection error."""
         # Mock connection error
@@ -116,21 +167,58 @@ class TestStockMarketClient(unittest.TestCase):
         with self.assertRaises(ConnectionError):
             self.client.get_quote("AAPL")
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_quote_timeout_error(self, mock_get):
         """Test quote retrieval with timeout error."""
-        # Mock timeout error
+        # Mock timeout error (raised once the adapter's retries are spent)
         mock_get.side_effect = requests.exceptions.Timeout("Request timeout")
-        
+
         with self.assertRaises(ConnectionError):
             self.client.get_quote("AAPL")
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
+    def test_get_quotes_bulk_success(self, mock_get):
+        """Test successful bulk quote retrieval."""
+        mock_response = make_response({
+            'data': [
+                {'symbol': 'AAPL', 'close': '150.00'},
+                {'symbol': 'MSFT', 'close': '300.00'}
+            ]
+        })
+        mock_get.return_value = mock_response
+
+        result = self.client.get_quotes(['aapl', 'MSFT'])
+
+        self.assertEqual(result['AAPL']['close'], '150.00')
+        self.assertEqual(result['MSFT']['close'], '300.00')
+        mock_get.assert_called_once()
+        sent = mock_get.call_args.kwargs['params']
+        self.assertEqual(sent['function'], 'REALTIME_BULK_QUOTES')
+        self.assertEqual(sent['symbol'], 'AAPL,MSFT')
+
+    @patch('requests.Session.get')
+    def test_get_quotes_chunks_at_100(self, mock_get):
+        """Test that more than 100 symbols are split across requests."""
+        mock_response = make_response({'data': []})
+        mock_get.return_value = mock_response
+
+        self.client.get_quotes([f"SYM{i}" for i in range(150)])
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_get_quotes_invalid_symbols(self):
+        """Test bulk quote retrieval with invalid symbols."""
+        with self.assertRaises(InvalidArgsError):
+            self.client.get_quotes([])
+
+        with self.assertRaises(InvalidArgsError):
+            self.client.get_quotes(['AAPL', ''])
+
+    @patch('requests.Session.get')
     def test_search_stocks_success(self, mock_get):
         """Test successful stock search."""
         # Mock successful search response
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = make_response({
             'bestMatches': [
                 {
                     '1. symbol': 'TSLA',
@@ -139,8 +227,7 @@ class TestStockMarketClient(unittest.TestCase):
                     '4. region': 'United States'
                 }
             ]
-        }
-        mock_response.raise_for_status.return_value = None
+        })
         mock_get.return_value = mock_response
         
         result = self.client.search_stocks("Tesla")
@@ -149,19 +236,17 @@ class TestStockMarketClient(unittest.TestCase):
         self.assertEqual(result[0]['1. symbol'], 'TSLA')
         self.assertEqual(result[0]['2. name'], 'Tesla Inc')
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_company_overview_success(self, mock_get):
         """Test successful company overview retrieval."""
         # Mock successful overview response
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = make_response({
             'Symbol': 'MSFT',
             'Name': 'Microsoft Corporation',
             'Sector': 'Technology',
             'Industry': 'Software—Infrastructure',
             'MarketCapitalization': '2500000000000'
-        }
-        mock_response.raise_for_status.return_value = None
+        })
         mock_get.return_value = mock_response
         
         result = self.client.get_company_overview("MSFT")
@@ -170,12 +255,11 @@ class TestStockMarketClient(unittest.TestCase):
         self.assertEqual(result['Name'], 'Microsoft Corporation')
         self.assertEqual(result['Sector'], 'Technology')
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_daily_data_success(self, mock_get):
         """Test successful daily data retrieval."""
         # Mock successful daily data response
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = make_response({
             'Time Series (Daily)': {
                 '2023-01-01': {
                     '1. open': '150.00',
@@ -185,21 +269,71 @@ class TestStockMarketClient(unittest.TestCase):
                     '5. volume': '1000000'
                 }
             }
-        }
-        mock_response.raise_for_status.return_value = None
+        })
         mock_get.return_value = mock_response
         
         result = self.client.get_daily_data("AAPL")
-        
-        self.assertIn('Time Series (Daily)', result)
-        self.assertIn('2023-01-01', result['Time Series (Daily)'])
+
+        self.assertIn('2023-01-01', result)
+        self.assertEqual(result['2023-01-01']['4. close'], '152.00')
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
+    def test_iter_daily_yields_parsed_rows_in_order(self, mock_get):
+        """Test that iter_daily yields typed tuples in ascending date order."""
+        mock_get.return_value = make_response({
+            'Time Series (Daily)': {
+                '2023-01-02': {
+                    '1. open': '152.00', '2. high': '156.00', '3. low': '151.00',
+                    '4. close': '155.00', '5. volume': '1200000'
+                },
+                '2023-01-01': {
+                    '1. open': '150.00', '2. high': '155.00', '3. low': '148.00',
+                    '4. close': '152.00', '5. volume': '1000000'
+                }
+            }
+        })
+
+        rows = list(self.client.iter_daily("AAPL"))
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0][0], '2023-01-01')
+        self.assertEqual(rows[1][0], '2023-01-02')
+        self.assertEqual(rows[0], ('2023-01-01', 150.0, 155.0, 148.0, 152.0, 1000000))
+
+    @patch('requests.Session.get')
+    def test_get_daily_frame_columnar(self, mock_get):
+        """Test that get_daily_frame builds a columnar frame, oldest first."""
+        try:
+            import numpy  # noqa: F401
+            import pandas  # noqa: F401
+        except ImportError:
+            self.skipTest("numpy/pandas not installed")
+
+        mock_get.return_value = make_response({
+            'Time Series (Daily)': {
+                '2023-01-02': {
+                    '1. open': '152.00', '2. high': '156.00', '3. low': '151.00',
+                    '4. close': '155.00', '5. volume': '1200000'
+                },
+                '2023-01-01': {
+                    '1. open': '150.00', '2. high': '155.00', '3. low': '148.00',
+                    '4. close': '152.00', '5. volume': '1000000'
+                }
+            }
+        })
+
+        frame = self.client.get_daily_frame("AAPL")
+
+        self.assertEqual(list(frame.columns), ['open', 'high', 'low', 'close', 'volume'])
+        self.assertEqual(len(frame), 2)
+        self.assertEqual(frame['close'].iloc[0], 152.0)
+        self.assertEqual(frame['volume'].iloc[1], 1200000)
+
+    @patch('requests.Session.get')
     def test_get_intraday_data_success(self, mock_get):
         """Test successful intraday data retrieval."""
         # Mock successful intraday data response
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = make_response({
             'Time Series (5min)': {
                 '2023-01-01 09:30:00': {
                     '1. open': '150.00',
@@ -209,8 +343,7 @@ class TestStockMarketClient(unittest.TestCase):
                     '5. volume': '100000'
                 }
             }
-        }
-        mock_response.raise_for_status.return_value = None
+        })
         mock_get.return_value = mock_response
         
         result = self.client.get_intraday_data("AAPL", interval="5min")
@@ -218,6 +351,13 @@ class TestStockMarketClient(unittest.TestCase):
         self.assertIn('Time Series (5min)', result)
         self.assertIn('2023-01-01 09:30:00', result['Time Series (5min)'])
     
+    def test_context_manager_closes_session(self):
+        """Test that the context manager closes the pooled session."""
+        with patch.object(requests.Session, 'close') as mock_close:
+            with StockMarketClient(self.api_key) as client:
+                self.assertIsInstance(client, StockMarketClient)
+            mock_close.assert_called_once()
+
     def test_invalid_symbol(self):
         """Test quote retrieval with invalid symbol."""
         with self.assertRaises(InvalidArgsError):
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the AsyncStockMarketClient.
+
+These tests verify the async client without making actual API calls by
+mocking the request layer.
+"""
+
+import unittest
+import os
+import sys
+from unittest.mock import patch, MagicMock, AsyncMock
+
+# Patch the logger before any imports that might use it
+patcher = patch('utils.logger.get_logger', return_value=MagicMock())
+patcher.start()
+
+# Add the parent directory to the path so we can import our client
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clients.alpha_vantage.async_client import AsyncStockMarketClient
+from clients.alpha_vantage.client import InvalidArgsError, APIError
+
+class TestAsyncStockMarketClient(unittest.IsolatedAsyncioTestCase):
+    """Test cases for AsyncStockMarketClient."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.api_key = "test_api_key"
+        self.client = AsyncStockMarketClient(self.api_key)
+
+    def test_init_with_api_key(self):
+        """Test client initialization with API key."""
+        client = AsyncStockMarketClient("test_api_key")
+        self.assertEqual(client.api_key, "test_api_key")
+        self.assertEqual(client.base_url, "https://www.alphavantage.co/query")
+        self.assertEqual(client.timeout, 30)
+        self.assertEqual(client.max_retries, 3)
+
+    def test_init_without_api_key(self):
+        """Test client initialization without API key raises error."""
+        with self.assertRaises(InvalidArgsError):
+            AsyncStockMarketClient()
+
+    async def test_request_without_session(self):
+        """Test that requests fail if the client is not opened."""
+        with self.assertRaises(APIError):
+            await self.client.get_quote("AAPL")
+
+    async def test_get_quote_success(self):
+        """Test successful quote retrieval."""
+        self.client._make_request = AsyncMock(return_value={
+            '01. symbol': 'AAPL',
+            '05. price': '150.00'
+        })
+
+        result = await self.client.get_quote("AAPL")
+
+        self.assertEqual(result['01. symbol'], 'AAPL')
+        self.assertEqual(result['05. price'], '150.00')
+
+    async def test_get_quotes_concurrent(self):
+        """Test that get_quotes fetches all symbols and preserves order."""
+        async def fake_request(params, response_key=None):
+            return {'01. symbol': params['symbol']}
+
+        self.client._make_request = AsyncMock(side_effect=fake_request)
+
+        result = await self.client.get_quotes(['AAPL', 'MSFT', 'TSLA'])
+
+        self.assertEqual(len(result), 3)
+        self.assertEqual([q['01. symbol'] for q in result], ['AAPL', 'MSFT', 'TSLA'])
+
+    async def test_get_quotes_invalid_symbols(self):
+        """Test get_quotes with an empty symbols list."""
+        with self.assertRaises(InvalidArgsError):
+            await self.client.get_quotes([])
+
+    async def test_invalid_symbol(self):
+        """Test quote retrieval with invalid symbol."""
+        with self.assertRaises(InvalidArgsError):
+            await self.client.get_quote("")
+
+    async def test_invalid_interval(self):
+        """Test intraday data retrieval with invalid interval."""
+        with self.assertRaises(InvalidArgsError):
+            await self.client.get_intraday_data("AAPL", interval="invalid")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the FileCache TTL cache in utils/cache.py.
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import time
+
+# Add the parent directory to the path so we can import utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cache import FileCache
+
+class TestFileCache(unittest.TestCase):
+    """Test cases for FileCache."""
+
+    def setUp(self):
+        """Set up a cache backed by a temporary directory."""
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._cache_dir.cleanup)
+        self.cache = FileCache(cache_dir=self._cache_dir.name)
+
+    def test_miss_returns_none(self):
+        """Test that an unknown key is a miss."""
+        self.assertIsNone(self.cache.get('GLOBAL_QUOTE', 'missing', ttl=60))
+
+    def test_set_then_get(self):
+        """Test that a stored entry is returned while fresh."""
+        self.cache.set('GLOBAL_QUOTE', 'key1', {'price': '150.00'})
+        self.assertEqual(
+            self.cache.get('GLOBAL_QUOTE', 'key1', ttl=60),
+            {'price': '150.00'}
+        )
+
+    def test_expired_entry_is_miss(self):
+        """Test that an entry older than its TTL is a miss."""
+        self.cache.set('GLOBAL_QUOTE', 'key1', {'price': '150.00'})
+        time.sleep(0.05)
+        self.assertIsNone(self.cache.get('GLOBAL_QUOTE', 'key1', ttl=0.01))
+
+    def test_disk_survives_new_instance(self):
+        """Test that a fresh cache instance reads entries written to disk."""
+        self.cache.set('OVERVIEW', 'key1', {'Symbol': 'MSFT'})
+        fresh = FileCache(cache_dir=self._cache_dir.name)
+        self.assertEqual(
+            fresh.get('OVERVIEW', 'key1', ttl=60),
+            {'Symbol': 'MSFT'}
+        )
+
+    def test_make_key_ignores_apikey(self):
+        """Test that the cache key does not depend on the API key."""
+        base = {'function': 'GLOBAL_QUOTE', 'symbol': 'AAPL'}
+        with_key = dict(base, apikey='secret')
+        self.assertEqual(FileCache.make_key(base), FileCache.make_key(with_key))
+
+    def test_make_key_varies_with_params(self):
+        """Test that different params produce different cache keys."""
+        self.assertNotEqual(
+            FileCache.make_key({'function': 'GLOBAL_QUOTE', 'symbol': 'AAPL'}),
+            FileCache.make_key({'function': 'GLOBAL_QUOTE', 'symbol': 'MSFT'})
+        )
+
+if __name__ == '__main__':
+    unittest.main()
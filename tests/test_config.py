@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for the Config loader in utils/config.py.
+"""
+
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.config import Config
+
+class TestConfig(unittest.TestCase):
+    """Test cases for Config."""
+
+    def _config_with(self, data):
+        """Build a Config whose loaded values are replaced with data."""
+        cfg = Config()
+        cfg._config = data
+        cfg._flat = cfg._flatten(data)
+        return cfg
+
+    def test_get_nested_value(self):
+        """Test dotted-path lookup of a nested value."""
+        cfg = self._config_with({'alpha_vantage': {'timeout': 30}})
+        self.assertEqual(cfg.get('alpha_vantage.timeout'), 30)
+
+    def test_get_intermediate_dict(self):
+        """Test that a dotted path to a section returns the sub-dict."""
+        cfg = self._config_with({'alpha_vantage': {'timeout': 30}})
+        self.assertEqual(cfg.get('alpha_vantage'), {'timeout': 30})
+
+    def test_get_missing_returns_default(self):
+        """Test that a missing path falls back to the default."""
+        cfg = self._config_with({'a': {'b': 1}})
+        self.assertIsNone(cfg.get('a.b.c'))
+        self.assertEqual(cfg.get('missing', 'fallback'), 'fallback')
+
+    def test_env_override(self):
+        """Test that APP_-prefixed environment variables override config."""
+        with patch.dict(os.environ, {'APP_ALPHA_VANTAGE': 'from-env'}):
+            cfg = Config()
+        self.assertEqual(cfg.get('alpha.vantage'), 'from-env')
+
+if __name__ == '__main__':
+    unittest.main()
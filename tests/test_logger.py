@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for the logger setup in utils/logger.py.
+"""
+
+import unittest
+import importlib
+import logging
+import os
+import sys
+from logging.handlers import RotatingFileHandler
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Other test modules patch utils.logger.get_logger at import time;
+# reload so these tests exercise the real implementation
+import utils.logger
+importlib.reload(utils.logger)
+from utils.logger import get_logger
+
+class TestGetLogger(unittest.TestCase):
+    """Test cases for get_logger."""
+
+    def test_repeated_calls_do_not_duplicate_handlers(self):
+        """Test that asking for the same logger twice keeps one handler set."""
+        with patch.dict(os.environ, {'ENV': 'test'}):
+            first = get_logger('test_logger_dedup')
+            handler_count = len(first.handlers)
+            second = get_logger('test_logger_dedup')
+
+        self.assertIs(first, second)
+        self.assertEqual(len(second.handlers), handler_count)
+
+    def test_no_file_handler_in_test_env(self):
+        """Test that ENV=test loggers skip the rotating file handler."""
+        with patch.dict(os.environ, {'ENV': 'test'}):
+            logger = get_logger('test_logger_no_file')
+
+        for handler in logger.handlers:
+            self.assertNotIsInstance(handler, RotatingFileHandler)
+
+    def test_level_is_applied(self):
+        """Test that the requested level is set on the logger."""
+        with patch.dict(os.environ, {'ENV': 'test'}):
+            logger = get_logger('test_logger_level', level=logging.WARNING)
+
+        self.assertEqual(logger.level, logging.WARNING)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Tests for the TokenBucket rate limiter in utils/ratelimit.py.
+"""
+
+import unittest
+import os
+import sys
+import time
+
+# Add the parent directory to the path so we can import utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.ratelimit import TokenBucket
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket."""
+
+    def test_burst_within_capacity_does_not_block(self):
+        """Test that a burst up to capacity goes through immediately."""
+        bucket = TokenBucket(rate=1.0, capacity=5)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_acquire_blocks_when_empty(self):
+        """Test that acquiring beyond capacity waits for a refill."""
+        bucket = TokenBucket(rate=50.0, capacity=1)
+        bucket.acquire()
+        start = time.monotonic()
+        bucket.acquire()
+        # One token at 50/s takes ~20ms to refill
+        self.assertGreaterEqual(time.monotonic() - start, 0.01)
+
+    def test_tokens_capped_at_capacity(self):
+        """Test that idle time does not accumulate tokens past capacity."""
+        bucket = TokenBucket(rate=1000.0, capacity=2)
+        time.sleep(0.02)
+        bucket.acquire()
+        bucket.acquire()
+        start = time.monotonic()
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.0005)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Simple disk + memory TTL cache for API responses.
+
+Entries are keyed by a hash of the request parameters and stored both in
+process memory and on disk as `.cache/{function}/{key}.json`, each file
+holding `{"ts": epoch, "data": {...}}`. A hit avoids the whole network
+round trip, which matters for rate-limited APIs.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, "..", ".cache")
+
+
+class FileCache:
+    """A TTL cache that keeps entries in memory and mirrors them on disk."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self._memory: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """Build a stable cache key from request params (ignoring apikey)."""
+        payload = {k: v for k, v in params.items() if k != "apikey"}
+        return hashlib.md5(
+            json.dumps(payload, sort_keys=True).encode()
+        ).hexdigest()
+
+    def _path(self, function: str, key: str) -> str:
+        return os.path.join(self.cache_dir, function, f"{key}.json")
+
+    def get(self, function: str, key: str, ttl: float) -> Optional[Any]:
+        """Return the cached data if it exists and is younger than ttl seconds."""
+        now = time.time()
+
+        entry = self._memory.get((function, key))
+        if entry is not None:
+            ts, data = entry
+            if now - ts < ttl:
+                return data
+
+        path = self._path(function, key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if now - entry["ts"] >= ttl:
+            return None
+
+        self._memory[(function, key)] = (entry["ts"], entry["data"])
+        return entry["data"]
+
+    def set(self, function: str, key: str, data: Any) -> None:
+        """Store data under (function, key), writing through to disk."""
+        now = time.time()
+        self._memory[(function, key)] = (now, data)
+
+        path = self._path(function, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                json.dump({"ts": now, "data": data}, f)
+        except OSError:
+            # Disk cache is best effort; the memory entry still serves hits
+            pass
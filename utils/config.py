@@ -11,6 +11,7 @@ class ConfigurationError(Exception):
 class Config:
     def __init__(self):
         self._config = {}
+        self._flat = {}
         self.load_config()
 
     def load_config(self) -> None:
@@ -25,6 +26,9 @@ class Config:
         # Override with environment variables
         self._override_from_env()
 
+        # Resolve dotted paths once so get() is a single dict lookup
+        self._flat = self._flatten(self._config)
+
     def _load_yaml(self, path: str) -> Dict[str, Any]:
         try:
             with open(path, "r") as f:
@@ -59,16 +63,19 @@ class Config:
             d = d.setdefault(key, {})
         d[path[-1]] = value
 
+    def _flatten(self, d: dict, prefix: str = "") -> Dict[str, Any]:
+        """Flatten nested config into {'a.b.c': value} for O(1) lookups."""
+        flat = {}
+        for key, value in d.items():
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                flat.update(self._flatten(value, f"{path}."))
+        return flat
+
     def get(self, path: str, default: Any = None) -> Any:
         """Get config value using dot notation."""
-        keys = path.split(".")
-        value = self._config
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return self._flat.get(path, default)
 
 
 # Create a singleton instance
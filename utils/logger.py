@@ -7,6 +7,9 @@ FORMATTER = logging.Formatter("%(asctime)s: [%(levelname)s] [%(name)s] %(message
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 LOG_FILE = os.path.join(BASE_DIR, "..", "agents.log")
 
+# One rotating file handler shared by every logger, created on first use
+_FILE_HANDLER = None
+
 
 def get_console_handler():
     console_handler = logging.StreamHandler(sys.stdout)
@@ -15,15 +18,17 @@ def get_console_handler():
 
 
 def get_file_handler():
-    try:
-        file_handler = RotatingFileHandler(
-            LOG_FILE, maxBytes=1024 * 1024, backupCount=5
-        )
-        file_handler.setFormatter(FORMATTER)
-        return file_handler
-    except PermissionError:
-        print("Permission denied to write to the log file.")
-        return None
+    global _FILE_HANDLER
+    if _FILE_HANDLER is None:
+        try:
+            _FILE_HANDLER = RotatingFileHandler(
+                LOG_FILE, maxBytes=1024 * 1024, backupCount=5
+            )
+            _FILE_HANDLER.setFormatter(FORMATTER)
+        except PermissionError:
+            print("Permission denied to write to the log file.")
+            return None
+    return _FILE_HANDLER
 
 
 def get_logger(logger_name, level=logging.DEBUG):
@@ -32,12 +37,19 @@ def get_logger(logger_name, level=logging.DEBUG):
     # better to have too much log than not enough
     logger.setLevel(level)
 
+    # Handlers are attached once per name; asking for the same logger
+    # again must not stack duplicates that multiply every emit
+    if logger.handlers:
+        return logger
+
     logger.addHandler(get_console_handler())
-    file_handler = get_file_handler()
-    if file_handler:
-        logger.addHandler(file_handler)
+    # Skip file logging for the test suite
+    if os.getenv("ENV") != "test":
+        file_handler = get_file_handler()
+        if file_handler:
+            logger.addHandler(file_handler)
 
     # with this pattern, it's rarely necessary to propagate the error up to parent
     logger.propagate = False
 
-    return logger
\ No newline at end of file
+    return logger
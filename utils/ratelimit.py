@@ -0,0 +1,40 @@
+"""
+Client-side rate limiting.
+
+A token bucket lets callers stay under a published request cap by turning
+would-be 429 responses into short local sleeps: bursts up to `capacity`
+go through immediately, and sustained traffic is smoothed to `rate`
+requests per second.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """A thread-safe token bucket. `acquire` blocks until a token is free."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._last_refill) * self.rate
+        )
+        self._last_refill = now
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until `tokens` tokens are available, then consume them."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)